@@ -59,6 +59,10 @@ To include only MESH or CURVE blocks and all data used by them:
 """
 
 import os
+import concurrent.futures
+import functools
+import importlib.util
+import itertools
 import json
 import re
 
@@ -69,43 +73,88 @@ del sys
 
 import blendfile
 
+# Size of encoded output accumulated before being written out at once.
+FILE_BUFFER_SIZE = 1024 * 1024
+# Number of array items encoded and joined together at once.
+ARRAY_BATCH_SIZE = 1024
 
-##### Utils (own json formatting) #####
 
+##### Utils (json formatting) #####
 
+
+def bytes_to_str(b):
+    return b.decode('ascii', 'backslashreplace')
+
+
+# Dispatched on the type of the value, called by the encoders for every value they do not natively support.
+@functools.singledispatch
 def json_default(o):
-    if isinstance(o, bytes):
-        return repr(o)[2:-1]
-    elif i is ...:
-        return "<...>"
-    return o
+    raise TypeError("Object of type %s is not JSON serializable" % type(o).__name__)
 
 
-def json_dumps(i):
-    return json.dumps(i, default=json_default)
+@json_default.register(bytes)
+def json_default_bytes(o):
+    return bytes_to_str(o)
 
 
-def keyval_to_json(kvs, indent, indent_step, compact_output=False):
-    if compact_output:
-        return ('{' + ', '.join('"%s": %s' % (k, v) for k, v in kvs) + '}')
-    else:
-        return ('{%s' % indent_step[:-1] +
-                (',\n%s%s' % (indent, indent_step)).join(
-                    ('"%s":\n%s%s%s' % (k, indent, indent_step, v) if (v[0] in {'[', '{'}) else
-                     '"%s": %s' % (k, v)) for k, v in kvs) +
-                '\n%s}' % indent)
+@json_default.register(type(...))
+def json_default_ellipsis(o):
+    return "<...>"
+
+
+# Optional encoders are only imported when explicitly requested, see the '--json-encoder' option.
+JSON_ENCODERS = ("json", "orjson", "msgspec")
+
 
+def json_encoder_create(encoder, compact_output=False):
+    """
+    Return a function encoding an object into JSON bytes, with the given encoder (one of ``JSON_ENCODERS``).
 
-def list_to_json(lst, indent, indent_step, compact_output=False):
-    if compact_output:
-        return ('[' + ', '.join(l for l in lst) + ']')
+    Output of all encoders is the same, except for floats: 'orjson' and 'msgspec' write exponents without
+    zero padding (e.g. '5.96e-8' instead of '5.96e-08'), and NaN and infinite values as 'null'.
+    """
+    if encoder == "orjson":
+        import orjson
+        option = 0 if compact_output else orjson.OPT_INDENT_2
+
+        def json_encode(obj):
+            return orjson.dumps(obj, default=json_default, option=option)
+    elif encoder == "msgspec":
+        import msgspec
+        # NOTE: msgspec encodes bytes as base64 without calling its hook, bytes values are converted to str beforehand.
+        msgspec_encoder = msgspec.json.Encoder(enc_hook=json_default)
+
+        def json_encode(obj):
+            data = msgspec_encoder.encode(obj)
+            return data if compact_output else msgspec.json.format(data, indent=2)
     else:
-        return ('[%s' % indent_step[:-1] +
-                ((',\n%s%s' % (indent, indent_step)).join(
-                    ('\n%s%s%s' % (indent, indent_step, l) if (i == 0 and l[0] in {'[', '{'}) else l)
-                    for i, l in enumerate(lst))
-                 ) +
-                '\n%s]' % indent)
+        # Same separators as the other encoders.
+        indent, separators = (None, (',', ':')) if compact_output else (2, (',', ': '))
+
+        def json_encode(obj):
+            return json.dumps(obj, indent=indent, separators=separators, ensure_ascii=True, check_circular=False,
+                              default=json_default).encode('ascii')
+    return json_encode
+
+
+# Only for small hashable values (DNA paths, names, integers...), those are highly repeated across blocks.
+@functools.lru_cache(maxsize=4096, typed=True)
+def json_dumps_hashable(v):
+    return json.dumps(v, default=json_default)
+
+
+def json_dumps_cached(v):
+    # Floats are never cached, equal values like 0.0 and -0.0 would share the same cache entry.
+    if type(v) in {list, float}:
+        return json.dumps(v, default=json_default)
+    return json_dumps_hashable(v)
+
+
+# Bounded by the amount of DNA paths, returns a single shared string for each path.
+@functools.lru_cache(maxsize=None)
+def json_key(k):
+    # DNA paths are bytes, or tuples of bytes and indices for nested/array fields.
+    return json_dumps_cached(k)[1:-1]
 
 
 ##### Main 'struct' writers #####
@@ -113,53 +162,85 @@ def list_to_json(lst, indent, indent_step, compact_output=False):
 def gen_fake_addresses(args, blend):
     if args.use_fake_address:
         hashes = set()
+        # {data_hash: next candidate value}, all values in between are already used,
+        # this avoids probing them again when many blocks share the same data hash.
+        next_free = {}
         ret = {}
         for block in blend.blocks:
             if not block.addr_old:
                 continue
-            hsh = block.get_data_hash()
+            data_hsh = block.get_data_hash()
+            hsh = next_free.get(data_hsh, data_hsh)
             while hsh in hashes:
                 hsh += 1
             hashes.add(hsh)
+            next_free[data_hsh] = hsh + 1
             ret[block.addr_old] = hsh
         return ret
 
     return {}
 
 
-def bheader_to_json(args, fw, blend, indent, indent_step):
-    fw('%s"%s": [\n' % (indent, "HEADER"))
-    indent = indent + indent_step
-
-    keyval = (
-        ("magic", json_dumps(blend.header.magic)),
-        ("pointer_size", json_dumps(blend.header.pointer_size)),
-        ("is_little_endian", json_dumps(blend.header.is_little_endian)),
-        ("version", json_dumps(blend.header.version)),
-    )
-    keyval = keyval_to_json(keyval, indent, indent_step)
-    fw('%s%s' % (indent, keyval))
-
-    indent = indent[:-len(indent_step)]
-    fw('\n%s]' % indent)
-
-
-def do_bblock_filter(filters, blend, block, meta_keyval, data_keyval):
-    def do_bblock_filter_data_recursive(blend, block, rec_lvl, rec_iter, key=None):
-        fields = (blend.structs[block.sdna_index].fields if key is None else
-                  [blend.structs[block.sdna_index].field_from_name.get(key[1:-1].encode())])
-        for fld in fields:
-            if fld is None:
-                continue
-            if fld.dna_name.is_pointer:
+def bheader_to_json(args, blend):
+    return [{
+        "magic": bytes_to_str(blend.header.magic),
+        "pointer_size": blend.header.pointer_size,
+        "is_little_endian": blend.header.is_little_endian,
+        "version": blend.header.version,
+    }]
+
+
+def do_bblock_filter(filters, blend, block, meta_keyval, gen_data_keyval, key_matches):
+    """
+    ``gen_data_keyval`` is only called if some filter actually has to check data fields of the block.
+
+    ``key_matches`` caches, for each filter key regex and DNA struct, the names of the meta and data keys it matches
+    (those are the same for all blocks of a same struct).
+    """
+    def do_bblock_filter_data_recursive(blend, block, rec_lvl, rec_iter, key_bytes=None):
+        # Walk pointed blocks with an explicit stack, a block already walked with the same or a higher remaining
+        # recursion level is not walked again (this also avoids looping over cycles of pointers).
+        # Only the first block may be restricted to a single field, so it is not registered as walked.
+        walked_lvl = {}
+        stack = [(block, rec_lvl, rec_iter, key_bytes)]
+        while stack:
+            block, rec_lvl, rec_iter, key_bytes = stack.pop()
+            dna_struct = blend.structs[block.sdna_index]
+            fields = dna_struct.fields if key_bytes is None else [dna_struct.field_from_name.get(key_bytes)]
+            child_user_data = max(block.user_data, rec_iter)
+            for fld in fields:
+                if fld is None or not fld.dna_name.is_pointer:
+                    continue
                 paths = ([(fld.dna_name.name_only, i) for i in range(fld.dna_name.array_size)]
                          if fld.dna_name.array_size > 1 else [fld.dna_name.name_only])
                 for p in paths:
                     child_block = block.get_pointer(p)
                     if child_block is not None:
-                        child_block.user_data = max(block.user_data, rec_iter)
-                        if rec_lvl != 0:
-                            do_bblock_filter_data_recursive(blend, child_block, rec_lvl - 1, rec_iter + 1)
+                        child_block.user_data = child_user_data
+                        if rec_lvl != 0 and walked_lvl.get(id(child_block), -1) < rec_lvl - 1:
+                            walked_lvl[id(child_block)] = rec_lvl - 1
+                            stack.append((child_block, rec_lvl - 1, rec_iter + 1, None))
+
+    # Values are matched against their JSON-ified representation.
+    def val_match(val, v):
+        return val.search(json_dumps_cached(v))
+
+    meta_map = dict(meta_keyval)
+    data_map = None
+
+    def get_data_map():
+        nonlocal data_map
+        if data_map is None:
+            data_map = dict(gen_data_keyval())
+        return data_map
+
+    def matching_keys(key):
+        cache_key = (key, block.sdna_index)
+        keys = key_matches.get(cache_key)
+        if keys is None:
+            keys = key_matches[cache_key] = ([k for k in meta_map if key.search(k)],
+                                             [k for k in get_data_map() if key.search(k)])
+        return keys
 
     has_include = False
     do_break = False
@@ -174,8 +255,9 @@ def do_bblock_filter(filters, blend, block, meta_keyval, data_keyval):
         if not include and block.user_data is not None:
             continue
         has_match = False
-        for k, v in meta_keyval:
-            if key.search(k) and val.search(v):
+        meta_keys, data_keys = matching_keys(key)
+        for k in meta_keys:
+            if val_match(val, meta_map[k]):
                 has_match = True
                 if include:
                     block.user_data = max(block.user_data, rec_iter)
@@ -185,13 +267,16 @@ def do_bblock_filter(filters, blend, block, meta_keyval, data_keyval):
                     block.user_data = min(block.user_data, -rec_iter)
                     do_break = True  # No need to check more filters in exclude case...
                     break
-        for k, v in data_keyval:
-            if key.search(k) and val.search(v):
+        if data_keys:
+            get_data_map()
+        for k in data_keys:
+            if val_match(val, data_map[k]):
                 has_match = True
                 if include:
                     block.user_data = max(block.user_data, rec_iter)
                     if rec_lvl != 0:
-                        do_bblock_filter_data_recursive(blend, block, rec_lvl - 1, rec_iter + 1, k)
+                        # Data keys are already un-quoted JSON-ified DNA names.
+                        do_bblock_filter_data_recursive(blend, block, rec_lvl - 1, rec_iter + 1, k.encode())
                     # Note that in include cases, we have to keep checking filters, since some 'include recursive'
                     # ones may still have to be processed...
                 else:
@@ -208,123 +293,214 @@ def do_bblock_filter(filters, blend, block, meta_keyval, data_keyval):
         block.user_data = max(block.user_data, rec_iter)
 
 
-def bblocks_to_json(args, fw, blend, address_map, indent, indent_step):
+def bblocks_to_json(args, blend, address_map):
+    """
+    Generate the dict of each block to output.
+    """
     no_address = args.no_address
     full_data = args.full_data
     filter_data = args.filter_data
+    block_filters = args.block_filters
+    use_data = bool(full_data or filter_data)
+    # {sdna_index: {path: is_pointer}}, all blocks of a same DNA struct share the same field paths.
+    pointer_cache = {}
 
     def gen_meta_keyval(blend, block):
         keyval = [
-            ("code", json_dumps(block.code)),
-            ("size", json_dumps(block.size)),
+            ("code", bytes_to_str(block.code)),
+            ("size", block.size),
         ]
         if not no_address:
-            keyval += [("addr_old", json_dumps(address_map.get(block.addr_old, block.addr_old)))]
+            keyval += [("addr_old", address_map.get(block.addr_old, block.addr_old))]
         keyval += [
-            ("dna_type_id", json_dumps(blend.structs[block.sdna_index].dna_type_id)),
-            ("count", json_dumps(block.count)),
+            ("dna_type_id", bytes_to_str(blend.structs[block.sdna_index].dna_type_id)),
+            ("count", block.count),
         ]
         return keyval
 
-    def gen_data_keyval(blend, block, key_filter=None):
+    def gen_data_keyval(blend, block, key_filter=None, items=None):
+        if items is None:
+            items = block.items_recursive_iter()
+        dna_struct = blend.structs[block.sdna_index]
+        is_pointer = pointer_cache.get(block.sdna_index)
+        if is_pointer is None:
+            is_pointer = pointer_cache[block.sdna_index] = {}
+
         def _is_pointer(k):
-            return blend.structs[block.sdna_index].field_from_path(blend.header, blend.handle, k).dna_name.is_pointer
+            ret = is_pointer.get(k)
+            if ret is None:
+                ret = is_pointer[k] = dna_struct.field_from_path(blend.header, blend.handle, k).dna_name.is_pointer
+            return ret
+
+        def _value(k, v):
+            if _is_pointer(k):
+                return address_map.get(v, v)
+            return bytes_to_str(v) if type(v) is bytes else v
         if key_filter is not None:
-            return [(json_dumps(k)[1:-1], json_dumps(address_map.get(v, v) if _is_pointer(k) else v))
-                    for k, v in block.items_recursive_iter() if k in key_filter]
-        return [(json_dumps(k)[1:-1], json_dumps(address_map.get(v, v) if _is_pointer(k) else v))
-                for k, v in block.items_recursive_iter()]
+            return [(json_key(k), _value(k, v)) for k, v in items if k in key_filter]
+        return [(json_key(k), _value(k, v)) for k, v in items]
 
-    if args.block_filters:
-        for block in blend.blocks:
-            meta_keyval = gen_meta_keyval(blend, block)
-            data_keyval = gen_data_keyval(blend, block)
-            do_bblock_filter(args.block_filters, blend, block, meta_keyval, data_keyval)
+    # {id(block): [(path, value), ...]}, data read while filtering, kept to be reused when outputting the blocks.
+    block_items_cache = {}
 
-    fw('%s"%s": [\n' % (indent, "DATA"))
-    indent = indent + indent_step
+    def gen_filter_data_keyval(blend, block):
+        items = list(block.items_recursive_iter())
+        if use_data:
+            block_items_cache[id(block)] = items
+        return gen_data_keyval(blend, block, items=items)
 
-    is_first = True
-    for i, block in enumerate(blend.blocks):
-        if block.user_data is None or block.user_data > 0:
-            meta_keyval = gen_meta_keyval(blend, block)
-            if full_data:
-                meta_keyval.append(("data", keyval_to_json(gen_data_keyval(blend, block),
-                                                           indent + indent_step, indent_step, args.compact_output)))
-            elif filter_data:
-                meta_keyval.append(("data", keyval_to_json(gen_data_keyval(blend, block, filter_data),
-                                                           indent + indent_step, indent_step, args.compact_output)))
-            keyval = keyval_to_json(meta_keyval, indent, indent_step, args.compact_output)
-            fw('%s%s%s' % ('' if is_first else ',\n', indent, keyval))
-            is_first = False
+    key_matches = {}
+
+    def filter_block(blend, block, meta_keyval):
+        do_bblock_filter(block_filters, blend, block, meta_keyval,
+                         functools.partial(gen_filter_data_keyval, blend, block), key_matches)
+
+    # Recursive include filters can include any block while filtering another one, so all blocks have to be filtered
+    # before any of them is output. Otherwise, each block can be filtered and output in a single pass.
+    is_filter_recursive = block_filters and any(include and rec_lvl != 0 for include, rec_lvl, _, _ in block_filters)
+    is_filter_single_pass = block_filters and not is_filter_recursive
 
-    indent = indent[:-len(indent_step)]
-    fw('\n%s]' % indent)
+    if is_filter_recursive:
+        for block in blend.blocks:
+            filter_block(blend, block, gen_meta_keyval(blend, block))
+        # Blocks are only known to be excluded once all of them have been filtered.
+        for block in blend.blocks:
+            if block.user_data is not None and block.user_data <= 0:
+                block_items_cache.pop(id(block), None)
+
+    for block in blend.blocks:
+        meta_keyval = None
+        if is_filter_single_pass:
+            meta_keyval = gen_meta_keyval(blend, block)
+            filter_block(blend, block, meta_keyval)
+        if block.user_data is not None and block.user_data <= 0:
+            block_items_cache.pop(id(block), None)
+            continue
+        if meta_keyval is None:
+            meta_keyval = gen_meta_keyval(blend, block)
+        if use_data:
+            items = block_items_cache.pop(id(block), None)
+            meta_keyval.append(("data", dict(gen_data_keyval(blend, block, filter_data, items))))
+        yield dict(meta_keyval)
 
 
-def bdna_to_json(args, fw, blend, indent, indent_step):
+def bdna_to_json(args, blend):
     full_dna = args.full_dna and not args.compact_output
 
-    def bdna_fields_to_json(blend, dna, indent, indent_step):
-        lst = []
-        for i, field in enumerate(dna.fields):
-            keyval = (
-                ("dna_name", json_dumps(field.dna_name.name_only)),
-                ("dna_type_id", json_dumps(field.dna_type.dna_type_id)),
-                ("is_pointer", json_dumps(field.dna_name.is_pointer)),
-                ("is_method_pointer", json_dumps(field.dna_name.is_method_pointer)),
-                ("array_size", json_dumps(field.dna_name.array_size)),
-            )
-            lst.append(keyval_to_json(keyval, indent + indent_step, indent_step))
-        return list_to_json(lst, indent, indent_step)
-
-    fw('%s"%s": [\n' % (indent, "DNA_STRUCT"))
-    indent = indent + indent_step
-
-    is_first = True
+    def bdna_fields_to_json(blend, dna):
+        return [{
+            "dna_name": bytes_to_str(field.dna_name.name_only),
+            "dna_type_id": bytes_to_str(field.dna_type.dna_type_id),
+            "is_pointer": field.dna_name.is_pointer,
+            "is_method_pointer": field.dna_name.is_method_pointer,
+            "array_size": field.dna_name.array_size,
+        } for field in dna.fields]
+
+    lst = []
     for dna in blend.structs:
-        keyval = [
-            ("dna_type_id", json_dumps(dna.dna_type_id)),
-            ("size", json_dumps(dna.size)),
-        ]
+        keyval = {
+            "dna_type_id": bytes_to_str(dna.dna_type_id),
+            "size": dna.size,
+        }
         if full_dna:
-            keyval += [("fields", bdna_fields_to_json(blend, dna, indent + indent_step, indent_step))]
+            keyval["fields"] = bdna_fields_to_json(blend, dna)
         else:
-            keyval += [("nbr_fields", json_dumps(len(dna.fields)))]
-        keyval = keyval_to_json(keyval, indent, indent_step, args.compact_output)
-        fw('%s%s%s' % ('' if is_first else ',\n', indent, keyval))
-        is_first = False
-
-    indent = indent[:-len(indent_step)]
-    fw('\n%s]' % indent)
-
-
-def blend_to_json(args, f, blend, address_map):
-    fw = f.write
-    fw('{\n')
-    indent = indent_step = "  "
-    bheader_to_json(args, fw, blend, indent, indent_step)
-    fw(',\n')
-    bblocks_to_json(args, fw, blend, address_map, indent, indent_step)
-    fw(',\n')
-    bdna_to_json(args, fw, blend, indent, indent_step)
-    fw('\n}\n')
+            keyval["nbr_fields"] = len(dna.fields)
+        lst.append(keyval)
+    return lst
+
+
+def blend_to_json(args, fd, blend, address_map):
+    json_encode = json_encoder_create(args.json_encoder, args.compact_output)
+    buf = bytearray()
+
+    def flush():
+        with memoryview(buf) as view:
+            written = 0
+            while written < len(view):
+                written += os.write(fd, view[written:])
+        buf.clear()
+
+    def fw(data):
+        buf.extend(data)
+        if len(buf) >= FILE_BUFFER_SIZE:
+            flush()
+
+    # Top-level arrays are streamed by batches of items, to avoid building the whole document in memory
+    # (and to keep one line per block/DNAStruct in compact output).
+    def dump_array(name, items):
+        fw(b'"%s": [\n' % name)
+        encoded_items = (json_encode(item) for item in items)
+        sep = b''
+        while True:
+            batch = list(itertools.islice(encoded_items, ARRAY_BATCH_SIZE))
+            if not batch:
+                break
+            fw(sep)
+            fw(b',\n'.join(batch))
+            sep = b',\n'
+        fw(b'\n]')
+
+    fw(b'{\n')
+    dump_array(b"HEADER", bheader_to_json(args, blend))
+    fw(b',\n')
+    dump_array(b"DATA", bblocks_to_json(args, blend, address_map))
+    fw(b',\n')
+    dump_array(b"DNA_STRUCT", bdna_to_json(args, blend))
+    fw(b'\n}\n')
+    flush()
 
 
 ##### Checks #####
 
 def check_file(args, blend):
-    addr_old = set()
-    for block in blend.blocks:
-        if block.addr_old in addr_old:
-            print("ERROR! Several data blocks share same 'addr_old' uuid %d, "
-                  "this should never happen!" % block.addr_old)
-            continue
-        addr_old.add(block.addr_old)
+    """
+    Return a list of report lines about found issues.
+    """
+    # Optional, only needed (and imported) when checking files.
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        addr_old = np.fromiter((block.addr_old for block in blend.blocks), dtype=np.uint64, count=len(blend.blocks))
+        addr_old, counts = np.unique(addr_old, return_counts=True)
+        is_dupli = counts > 1
+        duplis = zip(addr_old[is_dupli].tolist(), counts[is_dupli].tolist())
+    else:
+        counts = {}
+        for block in blend.blocks:
+            counts[block.addr_old] = counts.get(block.addr_old, 0) + 1
+        duplis = sorted((addr, count) for addr, count in counts.items() if count > 1)
+
+    return ["ERROR! %s: %d data blocks share same 'addr_old' uuid %d, "
+            "this should never happen!" % (blend.filepath_orig, count, addr)
+            for addr, count in duplis]
 
 
 ##### Main #####
 
+def convert_file(args, infile, outfile):
+    """
+    Return the report lines of the checks, printed by the caller (files may be processed in parallel).
+    """
+    report = []
+    with blendfile.open_blend(infile) as blend:
+        address_map = gen_fake_addresses(args, blend)
+
+        if args.check_file:
+            report = check_file(args, blend)
+
+        if outfile:
+            fd = os.open(outfile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+            try:
+                blend_to_json(args, fd, blend, address_map)
+            finally:
+                os.close(fd)
+    return report
+
+
 def argparse_create():
     import argparse
     global __doc__
@@ -372,6 +548,12 @@ def argparse_create():
     parser.add_argument(
         "--full-dna", dest="full_dna", default=False, action='store_true', required=False,
         help=("Also put in JSon file dna properties description (ignored when --compact-output is used)"))
+    parser.add_argument(
+        "--json-encoder", dest="json_encoder", default="json", choices=JSON_ENCODERS, required=False,
+        help=("Python module used to encode the JSon file, 'orjson' and 'msgspec' are much faster but optional, "
+              "and they format some floats differently from the default 'json' (e.g. '5.96e-8' instead of "
+              "'5.96e-08'), and write NaN/infinite values as 'null' "
+              "(so only compare JSon files generated with the same encoder)"))
 
     group = parser.add_argument_group("Filters", FILTER_DOC)
     group.add_argument(
@@ -385,7 +567,11 @@ def main():
     # ----------
     # Parse Args
 
-    args = argparse_create().parse_args()
+    parser = argparse_create()
+    args = parser.parse_args()
+
+    if importlib.util.find_spec(args.json_encoder) is None:
+        parser.error("JSon encoder '%s' is not available (module is not installed)" % args.json_encoder)
 
     if not args.output:
         if args.check_file:
@@ -405,16 +591,17 @@ def main():
         else:
             args.filter_data = {n.encode() for n in args.filter_data.split(',')}
 
-    for infile, outfile in zip(args.input, args.output):
-        with blendfile.open_blend(infile) as blend:
-            address_map = gen_fake_addresses(args, blend)
-
-            if args.check_file:
-                check_file(args, blend)
-
-            if outfile:
-                with open(outfile, 'w', encoding="ascii", errors='xmlcharrefreplace') as f:
-                    blend_to_json(args, f, blend, address_map)
+    if len(args.input) > 1:
+        # Files are fully independent, process them in parallel.
+        # Reports are still printed in input files order.
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for report in executor.map(convert_file, itertools.repeat(args), args.input, args.output):
+                for line in report:
+                    print(line)
+    else:
+        for infile, outfile in zip(args.input, args.output):
+            for line in convert_file(args, infile, outfile):
+                print(line)
 
 
 if __name__ == "__main__":